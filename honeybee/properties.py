@@ -5,16 +5,49 @@ These objects hold all attributes assigned by extensions like honeybee-radiance
 and honeybee-energy.  Note that these Property objects are not intended to exist
 on their own but should have a host object.
 """
+import traceback
+try:  # check if we are in cPython 3
+    from sys import intern
+except ImportError:  # we are in IronPython, where intern is a builtin
+    pass
 
+# cache of extension attribute names for each Properties class
+_EXT_ATTR_CACHE = {}
+# cache of (name, private_name, class, function) tuples for each Properties class
+# where the tables of each class are stored in a dictionary under the method name
+_EXT_METHOD_CACHE = {}
 
-class _Properties(object):
+
+class _PropertiesMeta(type):
+    """Metaclass that resets the extension attribute cache when a class is edited.
+
+    Extensions register themselves by setting new attributes on the Properties
+    classes (eg. FaceProperties.energy = property(...)) so any such edit must
+    invalidate the names that have been cached for the classes.
+    """
+
+    def __setattr__(cls, name, value):
+        type.__setattr__(cls, name, value)
+        _EXT_ATTR_CACHE.clear()
+        _EXT_METHOD_CACHE.clear()
+
+    def __delattr__(cls, name):
+        type.__delattr__(cls, name)
+        _EXT_ATTR_CACHE.clear()
+        _EXT_METHOD_CACHE.clear()
+
+
+class _Properties(_PropertiesMeta('_PropertiesBase', (object,), {'__slots__': ()})):
     """Base class for all Properties classes.
 
     Args:
         host: A honeybee-core geometry object that hosts these properties
             (ie. Model, Room, Face, Shade, Aperture, Door).
     """
-    _exclude = set(
+    # __dict__ is kept since extensions store their values on the instance
+    # under private attributes that they add to the class (eg. _energy)
+    __slots__ = ('_host', '__dict__', '__weakref__')
+    _exclude = frozenset(
         ('host', 'move', 'rotate', 'rotate_xy', 'reflect', 'scale', 'is_equivalent',
          'add_prefix', 'reset_to_default', 'to_dict', 'apply_properties_from_dict',
          'ToString'))
@@ -30,8 +63,86 @@ class _Properties(object):
 
     @property
     def _extension_attributes(self):
-        return (atr for atr in dir(self) if not atr.startswith('_')
-                and atr not in self._exclude)
+        """Get a tuple with the names of all attributes added by extensions."""
+        return self._extension_attrs()
+
+    def _extension_attrs(self):
+        """Get the extension attribute names, which are cached for each class."""
+        cls = type(self)
+        names = _EXT_ATTR_CACHE.get(cls)
+        if names is None:
+            # walk the class dictionaries since dir() also sorts the names
+            names, seen = [], set()
+            for klass in cls.__mro__:
+                for atr in klass.__dict__:
+                    if atr.startswith('_') or atr in cls._exclude or atr in seen:
+                        continue
+                    seen.add(atr)
+                    names.append(intern(atr))
+            names = tuple(names)
+            _EXT_ATTR_CACHE[cls] = names
+        return names
+
+    def _extension_methods(self, method):
+        """Get a tuple of (name, private_name, class, function) for extension attributes.
+
+        The private_name is the name of the attribute under which the extension
+        stores its value (eg. _energy). The class is that of the extension attribute
+        on the object that built the table and the function is the requested
+        method looked up on this class (or None if the class lacks the method).
+        The table is cached for each Properties class and so _extension_values
+        should be used to get the values and functions for a specific object.
+
+        Args:
+            method: Text for the name of the method to be looked up on each
+                extension attribute (eg. duplicate, to_dict).
+        """
+        cls = type(self)
+        cls_tables = _EXT_METHOD_CACHE.get(cls)
+        if cls_tables is None:
+            cls_tables = _EXT_METHOD_CACHE[cls] = {}
+        table = cls_tables.get(method)
+        if table is None:
+            table = []
+            for atr in self._extension_attrs():
+                var_cls = type(getattr(self, atr))
+                func = getattr(var_cls, method, None)
+                table.append((atr, intern('_' + atr), var_cls, func))
+            table = tuple(table)
+            cls_tables[method] = table
+        return table
+
+    def _extension_values(self, method, properties=None, include=None):
+        """Yield (name, private_name, value, function) for extension attributes.
+
+        Only the extension attributes with a value that has the requested method
+        are yielded. The functions can be called with the extension attribute
+        as the first argument (eg. func(var, host)). Note that class methods
+        (eg. from_dict) are bound to the class and so they should not be called
+        with the extension attribute.
+
+        Args:
+            method: Text for the name of the method to be looked up on each
+                extension attribute (eg. duplicate, to_dict).
+            properties: An optional Properties object of the same class as this
+                one from which the values will be taken. If None, the values
+                will be taken from this object. (Default: None).
+            include: An optional list of extension attribute names to filter the
+                yielded attributes. If None, all of the attributes will be yielded.
+                If an empty list, no attributes will be yielded. (Default: None).
+        """
+        if include is not None and not include:
+            return  # all of the extension attributes are excluded
+        props = self if properties is None else properties
+        _getattr = getattr
+        for atr, p_atr, var_cls, func in self._extension_methods(method):
+            if include is not None and atr not in include:
+                continue
+            var = _getattr(props, atr)
+            if type(var) is not var_cls:  # value differs from the one in the table
+                func = _getattr(type(var), method, None)
+            if func is not None:
+                yield atr, p_atr, var, func
 
     def move(self, moving_vec):
         """Apply a move transform to extension attributes.
@@ -45,14 +156,10 @@ class _Properties(object):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the face.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'move'):
-                continue
+        for atr, _, var, func in self._extension_values('move'):
             try:
-                var.move(moving_vec)
+                func(var, moving_vec)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to move {}: {}'.format(var, e))
 
@@ -70,14 +177,10 @@ class _Properties(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'rotate'):
-                continue
+        for atr, _, var, func in self._extension_values('rotate'):
             try:
-                var.rotate(axis, angle, origin)
+                func(var, axis, angle, origin)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to rotate {}: {}'.format(var, e))
 
@@ -94,14 +197,10 @@ class _Properties(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'rotate_xy'):
-                continue
+        for atr, _, var, func in self._extension_values('rotate_xy'):
             try:
-                var.rotate_xy(angle, origin)
+                func(var, angle, origin)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to rotate {}: {}'.format(var, e))
 
@@ -117,14 +216,10 @@ class _Properties(object):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'reflect'):
-                continue
+        for atr, _, var, func in self._extension_values('reflect'):
             try:
-                var.reflect(plane)
+                func(var, plane)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to reflect {}: {}'.format(var, e))
 
@@ -141,14 +236,10 @@ class _Properties(object):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'scale'):
-                continue
+        for atr, _, var, func in self._extension_values('scale'):
             try:
-                var.scale(factor, origin)
+                func(var, factor, origin)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to scale {}: {}'.format(var, e))
 
@@ -164,22 +255,18 @@ class _Properties(object):
                 will be tested.
         """
         eq_dict = {}
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'is_equivalent'):
-                continue
+        for atr, _, var, func in self._extension_values('is_equivalent'):
             other_var = getattr(other_properties, atr)
             try:
-                eq_dict[atr] = var.is_equivalent(other_var)
+                eq_dict[atr] = func(var, other_var)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed test is_equivalent for {}: {}'.format(var, e))
         return eq_dict
 
     def _update_by_sync(self, change, existing_prop, updated_prop):
         """Update properties using change instructions and existing/updated objects."""
-        for atr in self._extension_attributes:
+        for atr in self._extension_attrs():
             up_atr = 'update_{}'.format(atr)
             if up_atr in change:
                 var = getattr(updated_prop, atr) if change[up_atr] \
@@ -189,7 +276,6 @@ class _Properties(object):
                 try:
                     setattr(self, '_' + atr, var.duplicate(self.host))
                 except Exception as e:
-                    import traceback
                     traceback.print_exc()
                     raise Exception('Failed to duplicate {}: {}'.format(var, e))
 
@@ -206,14 +292,12 @@ class _Properties(object):
             original_properties: The properties object of the original core
                 object from which the duplicate was derived.
         """
-        for atr in self._extension_attributes:
-            var = getattr(original_properties, atr)
-            if not hasattr(var, 'duplicate'):
-                continue
+        _setattr, host = setattr, self._host
+        for atr, p_atr, var, func in \
+                self._extension_values('duplicate', original_properties):
             try:
-                setattr(self, '_' + atr, var.duplicate(self.host))
+                _setattr(self, p_atr, func(var, host))
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to duplicate {}: {}'.format(var, e))
 
@@ -233,14 +317,10 @@ class _Properties(object):
                 name. It is recommended that this name be short to avoid maxing
                 out the 100 allowable characters for honeybee names.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'add_prefix'):
-                continue
+        for atr, _, var, func in self._extension_values('add_prefix'):
             try:
-                var.add_prefix(prefix)
+                func(var, prefix)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to add prefix to {}: {}'.format(var, e))
 
@@ -255,14 +335,10 @@ class _Properties(object):
         Face type to AirBoundary will reset the extension attributes to the legal
         default values.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'reset_to_default'):
-                continue
+        for atr, _, var, func in self._extension_values('reset_to_default'):
             try:
-                var.reset_to_default()
+                func(var)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to reset_to_default for {}: {}'.format(var, e))
 
@@ -283,21 +359,22 @@ class _Properties(object):
                 it is full (not abridged), the program_type will be a complete
                 dictionary following the ProgramType schema. Abridged dictionaries
                 should be used within the Model.to_dict but full dictionaries should
-                be used within the to_dict methods of individual objects.
+                be used within the to_dict methods of individual objects. If None,
+                the to_dict methods of the extensions will be called without any
+                abridged argument, which is the case for ModelProperties.
             include: List of properties to filter keys that must be included in
                 output dictionary. For example ['energy'] will include 'energy' key if
                 available in properties to_dict. By default all the keys will be
                 included. To exclude all the keys from extensions use an empty list.
         """
-        attr = include if include is not None else self._extension_attributes
-        for atr in attr:
-            var = getattr(self, atr)
-            if not hasattr(var, 'to_dict'):
-                continue
+        base_update = base.update
+        for atr, _, var, func in self._extension_values('to_dict', include=include):
             try:
-                base.update(var.to_dict(abridged))
+                if abridged is None:
+                    base_update(func(var))
+                else:
+                    base_update(func(var, abridged))
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to convert {} to a dict: {}'.format(var, e))
         return base
@@ -316,15 +393,11 @@ class _Properties(object):
                 attributes from the dictionary and assign them to the object on
                 which this method is called.
         """
-        for atr in self._extension_attributes:
-            var = getattr(self, atr)
-            if not hasattr(var, 'from_dict'):
-                continue
-            try:
-                setattr(self, '_' + atr, var.__class__.from_dict(
-                    property_dict[atr], self.host))
-            except KeyError:
-                pass  # the property_dict possesses no properties for that extension
+        _setattr, host = setattr, self._host
+        for atr, p_atr, _, from_dict in self._extension_values('from_dict'):
+            if atr not in property_dict:
+                continue  # the property_dict possesses no properties for that extension
+            _setattr(self, p_atr, from_dict(property_dict[atr], host))
 
     def ToString(self):
         """Overwrite .NET ToString method."""
@@ -335,6 +408,65 @@ class _Properties(object):
         return 'BaseProperties'
 
 
+class _GeometryProperties(_Properties):
+    """Base class for the Properties of Room, Face, Aperture, Door, Shade and ShadeMesh.
+
+    Subclasses should set the _TYPE_FULL and _TYPE_ABRIDGED class attributes
+    to the type strings written by the to_dict method.
+
+    Args:
+        host: A honeybee-core geometry object that hosts these properties
+            (ie. Room, Face, Shade, Aperture, Door, ShadeMesh).
+    """
+    __slots__ = ()
+    _TYPE_FULL = 'GeometryProperties'
+    _TYPE_ABRIDGED = 'GeometryPropertiesAbridged'
+
+    def to_dict(self, abridged=False, include=None):
+        """Convert properties to dictionary.
+
+        Args:
+            abridged: Boolean to note whether the full dictionary describing the
+                object should be returned (False) or just an abridged version (True).
+                Default: False.
+            include: A list of keys to be included in dictionary.
+                If None all the available keys will be included.
+        """
+        base = {'type': self._TYPE_ABRIDGED if abridged else self._TYPE_FULL}
+        # mirrors the loop of _add_extension_attr_to_dict, which is inlined here
+        # since it runs for every object when a Model is serialized
+        base_update = base.update
+        for atr, _, var, func in self._extension_values('to_dict', include=include):
+            try:
+                base_update(func(var, abridged))
+            except Exception as e:
+                traceback.print_exc()
+                raise Exception('Failed to convert {} to a dict: {}'.format(var, e))
+        return base
+
+    def add_prefix(self, prefix):
+        """Change the identifier extension attributes unique to this object by adding a prefix.
+
+        Notably, this method only adds the prefix to extension attributes that must
+        be unique to the host object (eg. single-room HVAC systems) and does not
+        add the prefix to attributes that are shared across several objects
+        (eg. ConstructionSets).
+
+        Args:
+            prefix: Text that will be inserted at the start of extension attribute identifiers.
+        """
+        self._add_prefix_extension_attr(prefix)
+
+    def reset_to_default(self):
+        """Reset the extension properties assigned to the host object to default.
+
+        This typically means erasing any Constructions or Modifiers assigned to
+        the object (having them instead assigned by ConstructionSets and ModifierSets)
+        or erasing any ConstructionSets or ModifierSets assigned to a Room.
+        """
+        self._reset_extension_attr_to_default()
+
+
 class ModelProperties(_Properties):
     """Honeybee Model Properties.
 
@@ -349,6 +481,8 @@ class ModelProperties(_Properties):
         model.properties.radiance -> ModelRadianceProperties
         model.properties.energy -> ModelEnergyProperties
     """
+    __slots__ = ()
+    _TYPE_FULL = 'ModelProperties'
 
     def to_dict(self, include=None):
         """Convert properties to dictionary.
@@ -357,19 +491,9 @@ class ModelProperties(_Properties):
             include: A list of keys to be included in dictionary.
                 If None all the available keys will be included.
         """
-        base = {'type': 'ModelProperties'}
-        attr = include if include is not None else self._extension_attributes
-        for atr in attr:
-            var = getattr(self, atr)
-            if not hasattr(var, 'to_dict'):
-                continue
-            try:
-                base.update(var.to_dict())  # no abridged dictionary for model
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                raise Exception('Failed to convert {} to a dict: {}'.format(var, e))
-        return base
+        base = {'type': self._TYPE_FULL}
+        # no abridged dictionary for model
+        return self._add_extension_attr_to_dict(base, None, include)
 
     def apply_properties_from_dict(self, data):
         """Apply extension properties from a Model dictionary to the host Model.
@@ -377,7 +501,7 @@ class ModelProperties(_Properties):
         Args:
             data: A dictionary representation of an entire honeybee-core Model.
         """
-        for atr in self._extension_attributes:
+        for atr in self._extension_attrs():
             if atr not in data['properties'] or data['properties'][atr] is None:
                 continue
             var = getattr(self, atr)
@@ -386,7 +510,6 @@ class ModelProperties(_Properties):
             try:
                 var.apply_properties_from_dict(data)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception(
                     'Failed to apply {} properties to the Model: {}'.format(atr, e))
@@ -403,7 +526,7 @@ class ModelProperties(_Properties):
                 dicts with error info or a string with a message. (Default: False).
         """
         msgs = []
-        for atr in self._extension_attributes:
+        for atr in self._extension_attrs():
             check_msg = None
             var = getattr(self, atr)
             if not hasattr(var, 'check_all'):
@@ -419,7 +542,6 @@ class ModelProperties(_Properties):
                     f_msg = 'Attributes for {} are invalid.\n{}'.format(atr, check_msg)
                     msgs.append(f_msg)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 raise Exception('Failed to check_all for {}: {}'.format(var, e))
         return msgs
@@ -429,7 +551,7 @@ class ModelProperties(_Properties):
         return 'ModelProperties: {}'.format(self.host.display_name)
 
 
-class RoomProperties(_Properties):
+class RoomProperties(_GeometryProperties):
     """Honeybee Room Properties.
 
     This class will be extended by extensions.
@@ -443,49 +565,16 @@ class RoomProperties(_Properties):
         room.properties.radiance -> RoomRadianceProperties
         room.properties.energy -> RoomEnergyProperties
     """
-
-    def to_dict(self, abridged=False, include=None):
-        """Convert properties to dictionary.
-
-        Args:
-            abridged: Boolean to note whether the full dictionary describing the
-                object should be returned (False) or just an abridged version (True).
-                Default: False.
-            include: A list of keys to be included in dictionary.
-                If None all the available keys will be included.
-        """
-        base = {'type': 'RoomProperties'} if not abridged else \
-            {'type': 'RoomPropertiesAbridged'}
-
-        base = self._add_extension_attr_to_dict(base, abridged, include)
-        return base
-
-    def add_prefix(self, prefix):
-        """Change the identifier extension attributes unique to this object by adding a prefix.
-
-        Notably, this method only adds the prefix to extension attributes that must
-        be unique to the Room (eg. single-room HVAC systems) and does not add the
-        prefix to attributes that are shared across several Rooms (eg. ConstructionSets).
-
-        Args:
-            prefix: Text that will be inserted at the start of extension attribute identifiers.
-        """
-        self._add_prefix_extension_attr(prefix)
-
-    def reset_to_default(self):
-        """Reset the extension properties assigned at the level of this Room to default.
-
-        This typically means erasing any ConstructionSets or ModifierSets assigned
-        to this Room among other properties.
-        """
-        self._reset_extension_attr_to_default()
+    __slots__ = ()
+    _TYPE_FULL = 'RoomProperties'
+    _TYPE_ABRIDGED = 'RoomPropertiesAbridged'
 
     def __repr__(self):
         """Properties representation."""
         return 'RoomProperties: {}'.format(self.host.display_name)
 
 
-class FaceProperties(_Properties):
+class FaceProperties(_GeometryProperties):
     """Honeybee Face Properties.
 
     This class will be extended by extensions.
@@ -499,48 +588,16 @@ class FaceProperties(_Properties):
         face.properties.radiance -> FaceRadianceProperties
         face.properties.energy -> FaceEnergyProperties
     """
-
-    def to_dict(self, abridged=False, include=None):
-        """Convert properties to dictionary.
-
-        Args:
-            abridged: Boolean to note whether the full dictionary describing the
-                object should be returned (False) or just an abridged version (True).
-                Default: False.
-            include: A list of keys to be included in dictionary besides Face type
-                and boundary_condition. If None all the available keys will be included.
-        """
-        base = {'type': 'FaceProperties'} if not abridged else \
-            {'type': 'FacePropertiesAbridged'}
-        base = self._add_extension_attr_to_dict(base, abridged, include)
-        return base
-
-    def add_prefix(self, prefix):
-        """Change the identifier extension attributes unique to this object by adding a prefix.
-
-        Notably, this method only adds the prefix to extension attributes that must
-        be unique to the Face and does not add the prefix to attributes that are
-        shared across several Faces.
-
-        Args:
-            prefix: Text that will be inserted at the start of extension attribute identifiers.
-        """
-        self._add_prefix_extension_attr(prefix)
-
-    def reset_to_default(self):
-        """Reset the extension properties assigned at the level of this Face to default.
-
-        This typically means erasing any Constructions or Modifiers assigned to this
-        Face (having them instead assigned by ConstructionSets and ModifierSets).
-        """
-        self._reset_extension_attr_to_default()
+    __slots__ = ()
+    _TYPE_FULL = 'FaceProperties'
+    _TYPE_ABRIDGED = 'FacePropertiesAbridged'
 
     def __repr__(self):
         """Properties representation."""
         return 'FaceProperties: {}'.format(self.host.display_name)
 
 
-class ApertureProperties(_Properties):
+class ApertureProperties(_GeometryProperties):
     """Honeybee Aperture Properties.
 
     This class will be extended by extensions.
@@ -554,49 +611,16 @@ class ApertureProperties(_Properties):
         aperture.properties.radiance -> ApertureRadianceProperties
         aperture.properties.energy -> ApertureEnergyProperties
     """
-
-    def to_dict(self, abridged=False, include=None):
-        """Convert properties to dictionary.
-
-        Args:
-            abridged: Boolean to note whether the full dictionary describing the
-                object should be returned (False) or just an abridged version (True).
-                Default: False.
-            include: A list of keys to be included in dictionary.
-                If None all the available keys will be included.
-        """
-        base = {'type': 'ApertureProperties'} if not abridged else \
-            {'type': 'AperturePropertiesAbridged'}
-
-        base = self._add_extension_attr_to_dict(base, abridged, include)
-        return base
-
-    def add_prefix(self, prefix):
-        """Change the identifier extension attributes unique to this object by adding a prefix.
-
-        Notably, this method only adds the prefix to extension attributes that must
-        be unique to the Aperture and does not add the prefix to attributes that are
-        shared across several Apertures.
-
-        Args:
-            prefix: Text that will be inserted at the start of extension attribute identifiers.
-        """
-        self._add_prefix_extension_attr(prefix)
-
-    def reset_to_default(self):
-        """Reset the extension properties assigned to this Aperture to default.
-
-        This typically means erasing any Constructions or Modifiers assigned to this
-        Aperture (having them instead assigned by ConstructionSets and ModifierSets).
-        """
-        self._reset_extension_attr_to_default()
+    __slots__ = ()
+    _TYPE_FULL = 'ApertureProperties'
+    _TYPE_ABRIDGED = 'AperturePropertiesAbridged'
 
     def __repr__(self):
         """Properties representation."""
         return 'ApertureProperties: {}'.format(self.host.display_name)
 
 
-class DoorProperties(_Properties):
+class DoorProperties(_GeometryProperties):
     """Honeybee Door Properties.
 
     This class will be extended by extensions.
@@ -610,49 +634,16 @@ class DoorProperties(_Properties):
         door.properties.radiance -> DoorRadianceProperties
         door.properties.energy -> DoorEnergyProperties
     """
-
-    def to_dict(self, abridged=False, include=None):
-        """Convert properties to dictionary.
-
-        Args:
-            abridged: Boolean to note whether the full dictionary describing the
-                object should be returned (False) or just an abridged version (True).
-                Default: False.
-            include: A list of keys to be included in dictionary.
-                If None all the available keys will be included.
-        """
-        base = {'type': 'DoorProperties'} if not abridged else \
-            {'type': 'DoorPropertiesAbridged'}
-
-        base = self._add_extension_attr_to_dict(base, abridged, include)
-        return base
-
-    def add_prefix(self, prefix):
-        """Change the identifier extension attributes unique to this object by adding a prefix.
-
-        Notably, this method only adds the prefix to extension attributes that must
-        be unique to the Door and does not add the prefix to attributes that are
-        shared across several Doors.
-
-        Args:
-            prefix: Text that will be inserted at the start of extension attribute identifiers.
-        """
-        self._add_prefix_extension_attr(prefix)
-
-    def reset_to_default(self):
-        """Reset the extension properties assigned to this Door to default.
-
-        This typically means erasing any Constructions or Modifiers assigned to this
-        Door (having them instead assigned by ConstructionSets and ModifierSets).
-        """
-        self._reset_extension_attr_to_default()
+    __slots__ = ()
+    _TYPE_FULL = 'DoorProperties'
+    _TYPE_ABRIDGED = 'DoorPropertiesAbridged'
 
     def __repr__(self):
         """Properties representation."""
         return 'DoorProperties: {}'.format(self.host.display_name)
 
 
-class ShadeProperties(_Properties):
+class ShadeProperties(_GeometryProperties):
     """Honeybee Shade Properties.
 
     This class will be extended by extensions.
@@ -666,49 +657,16 @@ class ShadeProperties(_Properties):
         shade.properties.radiance -> ShadeRadianceProperties
         shade.properties.energy -> ShadeEnergyProperties
     """
-
-    def to_dict(self, abridged=False, include=None):
-        """Convert properties to dictionary.
-
-        Args:
-            abridged: Boolean to note whether the full dictionary describing the
-                object should be returned (False) or just an abridged version (True).
-                Default: False.
-            include: A list of keys to be included in dictionary.
-                If None all the available keys will be included.
-        """
-        base = {'type': 'ShadeProperties'} if not abridged else \
-            {'type': 'ShadePropertiesAbridged'}
-
-        base = self._add_extension_attr_to_dict(base, abridged, include)
-        return base
-
-    def add_prefix(self, prefix):
-        """Change the identifier extension attributes unique to this object by adding a prefix.
-
-        Notably, this method only adds the prefix to extension attributes that must
-        be unique to the Shade and does not add the prefix to attributes that are
-        shared across several Shades.
-
-        Args:
-            prefix: Text that will be inserted at the start of extension attribute identifiers.
-        """
-        self._add_prefix_extension_attr(prefix)
-
-    def reset_to_default(self):
-        """Reset the extension properties assigned at the level of this Shade to default.
-
-        This typically means erasing any Constructions or Modifiers assigned to this
-        Shade (having them instead assigned by ConstructionSets and ModifierSets).
-        """
-        self._reset_extension_attr_to_default()
+    __slots__ = ()
+    _TYPE_FULL = 'ShadeProperties'
+    _TYPE_ABRIDGED = 'ShadePropertiesAbridged'
 
     def __repr__(self):
         """Properties representation."""
         return 'ShadeProperties: {}'.format(self.host.display_name)
 
 
-class ShadeMeshProperties(_Properties):
+class ShadeMeshProperties(_GeometryProperties):
     """Honeybee ShadeMesh Properties.
 
     This class will be extended by extensions.
@@ -722,42 +680,9 @@ class ShadeMeshProperties(_Properties):
         shade.properties.radiance -> ShadeMeshRadianceProperties
         shade.properties.energy -> ShadeMeshEnergyProperties
     """
-
-    def to_dict(self, abridged=False, include=None):
-        """Convert properties to dictionary.
-
-        Args:
-            abridged: Boolean to note whether the full dictionary describing the
-                object should be returned (False) or just an abridged version (True).
-                Default: False.
-            include: A list of keys to be included in dictionary.
-                If None all the available keys will be included.
-        """
-        base = {'type': 'ShadeMeshProperties'} if not abridged else \
-            {'type': 'ShadeMeshPropertiesAbridged'}
-
-        base = self._add_extension_attr_to_dict(base, abridged, include)
-        return base
-
-    def add_prefix(self, prefix):
-        """Change the identifier extension attributes unique to this object by adding a prefix.
-
-        Notably, this method only adds the prefix to extension attributes that must
-        be unique to the ShadeMesh and does not add the prefix to attributes that are
-        shared across several ShadeMeshes (eg. modifier).
-
-        Args:
-            prefix: Text that will be inserted at the start of extension attribute identifiers.
-        """
-        self._add_prefix_extension_attr(prefix)
-
-    def reset_to_default(self):
-        """Reset the extension properties assigned to this ShadeMesh to default.
-
-        This typically means erasing any Constructions or Modifiers assigned to this
-        ShadeMesh.
-        """
-        self._reset_extension_attr_to_default()
+    __slots__ = ()
+    _TYPE_FULL = 'ShadeMeshProperties'
+    _TYPE_ABRIDGED = 'ShadeMeshPropertiesAbridged'
 
     def __repr__(self):
         """Properties representation."""
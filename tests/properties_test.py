@@ -0,0 +1,172 @@
+"""Test the Properties classes that hold the attributes of extensions."""
+from honeybee.properties import ModelProperties, FaceProperties
+
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from honeybee.face import Face
+
+import weakref
+
+
+class DummyFaceExtensionProperties(object):
+    """Simple extension properties object used to test the Properties classes."""
+
+    def __init__(self, host, value=0):
+        self.host = host
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, data, host):
+        return cls(host, data['value'])
+
+    def to_dict(self, abridged=False):
+        base = {'type': 'DummyAbridged' if abridged else 'Dummy', 'value': self.value}
+        return {'dummy': base}
+
+    def duplicate(self, new_host=None):
+        return DummyFaceExtensionProperties(new_host, self.value)
+
+
+def _extended_properties_class():
+    """Get a FaceProperties subclass with a registered dummy extension."""
+    class ExtendedFaceProperties(FaceProperties):
+        pass
+
+    def dummy_properties(self):
+        if self._dummy is None:
+            self._dummy = DummyFaceExtensionProperties(self.host)
+        return self._dummy
+
+    ExtendedFaceProperties._dummy = None
+    ExtendedFaceProperties.dummy = property(dummy_properties)
+    return ExtendedFaceProperties
+
+
+def _test_face(identifier='Test_Face'):
+    pts = (Point3D(0, 0, 0), Point3D(0, 0, 3), Point3D(1, 0, 3), Point3D(1, 0, 0))
+    return Face.from_vertices(identifier, pts)
+
+
+def test_extension_attributes():
+    """Test that extension attributes are found for registered extensions."""
+    face = _test_face()
+    assert tuple(face.properties._extension_attributes) == ()
+
+    ext_class = _extended_properties_class()
+    props = ext_class(face)
+    assert tuple(props._extension_attributes) == ('dummy',)
+
+
+def test_extension_attributes_cache_reset():
+    """Test that cached extension attributes are reset when an extension registers."""
+    ext_class = _extended_properties_class()
+    props = ext_class(_test_face())
+    assert tuple(props._extension_attributes) == ('dummy',)
+
+    ext_class._other = None
+    ext_class.other = property(lambda self: None)
+    assert sorted(props._extension_attributes) == ['dummy', 'other']
+
+    del ext_class.other
+    assert tuple(props._extension_attributes) == ('dummy',)
+
+
+def test_to_dict_no_extensions():
+    """Test that dictionaries without extension attributes are not shared."""
+    props = _test_face().properties
+    base_1 = props.to_dict(True)
+    base_2 = props.to_dict(True)
+    assert base_1 == base_2 == {'type': 'FacePropertiesAbridged'}
+    base_1['energy'] = {}
+    assert props.to_dict(True) == {'type': 'FacePropertiesAbridged'}
+
+
+def test_weakref():
+    """Test that Properties objects can be weakly referenced."""
+    face = _test_face()
+    ref = weakref.ref(face.properties)
+    assert ref() is face.properties
+
+
+def test_model_properties_methods():
+    """Test that ModelProperties lacks the methods only used by geometry objects."""
+    assert not hasattr(ModelProperties, 'add_prefix')
+    assert not hasattr(ModelProperties, 'reset_to_default')
+    assert not hasattr(ModelProperties, '_TYPE_ABRIDGED')
+    assert hasattr(FaceProperties, 'add_prefix')
+    assert hasattr(FaceProperties, 'reset_to_default')
+
+
+def test_extension_methods():
+    """Test the lookup of methods on extension attributes."""
+    ext_class = _extended_properties_class()
+    props = ext_class(_test_face())
+    table = props._extension_methods('duplicate')
+    assert table == (('dummy', '_dummy', DummyFaceExtensionProperties,
+                      DummyFaceExtensionProperties.duplicate),)
+    assert tuple(props._extension_values('duplicate')) == \
+        (('dummy', '_dummy', props.dummy, DummyFaceExtensionProperties.duplicate),)
+    assert tuple(props._extension_values('move')) == ()
+
+
+def test_extension_values_none():
+    """Test that extension values differing between objects are handled correctly."""
+    class NoneFaceProperties(FaceProperties):
+        pass
+
+    def dummy_properties(self):
+        if self.host.identifier == 'Face_B':
+            return None
+        if self._dummy is None:
+            self._dummy = DummyFaceExtensionProperties(self.host, 5)
+        return self._dummy
+
+    NoneFaceProperties._dummy = None
+    NoneFaceProperties.dummy = property(dummy_properties)
+    expected_a = {'type': 'FaceProperties', 'dummy': {'type': 'Dummy', 'value': 5}}
+    expected_b = {'type': 'FaceProperties'}
+
+    face_a, face_b = _test_face('Face_A'), _test_face('Face_B')
+    props_a, props_b = NoneFaceProperties(face_a), NoneFaceProperties(face_b)
+    assert props_b.to_dict() == expected_b
+    assert props_a.to_dict() == expected_a
+
+    NoneFaceProperties._other = None  # reset the cache
+    props_a, props_b = NoneFaceProperties(face_a), NoneFaceProperties(face_b)
+    assert props_a.to_dict() == expected_a
+    assert props_b.to_dict() == expected_b
+
+
+def test_to_dict_from_dict():
+    """Test the serialization of extension attributes to and from dictionaries."""
+    ext_class = _extended_properties_class()
+    face = _test_face()
+    props = ext_class(face)
+    props.dummy.value = 5
+
+    full_dict = props.to_dict()
+    assert full_dict == {'type': 'FaceProperties',
+                         'dummy': {'type': 'Dummy', 'value': 5}}
+    abridged_dict = props.to_dict(True)
+    assert abridged_dict['type'] == 'FacePropertiesAbridged'
+    assert abridged_dict['dummy']['type'] == 'DummyAbridged'
+    assert props.to_dict(include=[]) == {'type': 'FaceProperties'}
+
+    new_props = ext_class(face)
+    new_props._load_extension_attr_from_dict(full_dict)
+    assert new_props.dummy.value == 5
+    new_props._load_extension_attr_from_dict({'type': 'FaceProperties'})
+    assert new_props.dummy.value == 5
+
+
+def test_duplicate_extension_attr():
+    """Test the duplication of extension attributes."""
+    ext_class = _extended_properties_class()
+    props = ext_class(_test_face())
+    props.dummy.value = 5
+
+    new_face = _test_face()
+    new_props = ext_class(new_face)
+    new_props._duplicate_extension_attr(props)
+    assert new_props.dummy.value == 5
+    assert new_props.dummy is not props.dummy
+    assert new_props.dummy.host is new_face